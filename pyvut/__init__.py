@@ -2,6 +2,7 @@
 
 from .tracker_core import (
     DongleHID,
+    PoseSample,
     TrackerHID,
     ViveTrackerGroup,
     current_milli_time,
@@ -12,6 +13,7 @@ from .api import TrackerPose, UltimateTrackerAPI, TrackerService
 
 __all__ = [
     "DongleHID",
+    "PoseSample",
     "TrackerHID",
     "ViveTrackerGroup",
     "TrackerPose",
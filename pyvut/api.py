@@ -2,57 +2,187 @@
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
+import functools
 import logging
 import multiprocessing as mp
+import os
 from multiprocessing import shared_memory
+import struct
 import threading
 import time
-from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Optional
+import warnings
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import numpy as np
 
-from .tracker_core import ViveTrackerGroup, mac_str
+from .tracker_core import PoseSample, ViveTrackerGroup, mac_str
 
 logger = logging.getLogger(__name__)
 
 POSE_SLOTS = 5
 POSE_FIELDS = 11  # [px, py, pz, rw, rx, ry, rz, timestamp_ms, buttons, tracking_status, valid_flag]
 MAC_STR_LEN = 64
+CACHE_LINE_BYTES = 64
+
+RING_DEPTH = 32  # records kept per tracker slot; must be a power of two
+assert RING_DEPTH & (RING_DEPTH - 1) == 0
+
+# The whole table lives in one shared memory block: a header with the layout description on one
+# cache line and every slot's ring tail (uint64[POSE_SLOTS]) on the next, followed by POSE_SLOTS
+# slot blocks. Each slot block holds the tracker MAC on its own cache line, then RING_DEPTH records
+# of write_time | pose fields. Everything is padded to whole cache lines so the writer filling one
+# record never bounces the line a reader is on.
+assert POSE_SLOTS * 8 <= CACHE_LINE_BYTES
+_HEADER_DTYPE = np.dtype(
+    {
+        "names": ["magic", "version", "slots", "ring_depth", "slot_bytes", "tails"],
+        "formats": [np.uint32, np.uint32, np.uint32, np.uint32, np.uint32, (np.uint64, POSE_SLOTS)],
+        "offsets": [0, 4, 8, 12, 16, CACHE_LINE_BYTES],
+        "itemsize": 2 * CACHE_LINE_BYTES,
+    }
+)
+_LAYOUT_FIELDS = ("magic", "version", "slots", "ring_depth", "slot_bytes")
+RECORD_BYTES = -(-(8 + POSE_FIELDS * 8) // CACHE_LINE_BYTES) * CACHE_LINE_BYTES
+_RECORD_DTYPE = np.dtype(
+    {
+        "names": ["write_time", "pose"],
+        "formats": [np.float64, (np.float64, POSE_FIELDS)],
+        "offsets": [0, 8],
+        "itemsize": RECORD_BYTES,
+    }
+)
+_SLOT_DTYPE = np.dtype(
+    {
+        "names": ["mac", "records"],
+        "formats": [(np.uint8, MAC_STR_LEN), (_RECORD_DTYPE, RING_DEPTH)],
+        "offsets": [0, CACHE_LINE_BYTES],
+        "itemsize": CACHE_LINE_BYTES + RING_DEPTH * RECORD_BYTES,
+    }
+)
+_SHM_MAGIC = 0x54555650  # "PVUT"
+_SHM_VERSION = 3
+_SHM_BYTES = _HEADER_DTYPE.itemsize + POSE_SLOTS * _SLOT_DTYPE.itemsize
+
+# One pose message of the pipe transport:
+# tracker_index, tracking_status, buttons, timestamp_ms, write_time, px..rz, mac.
+_PIPE_POSE_STRUCT = struct.Struct(f"<BBIqd7d{MAC_STR_LEN - 1}s")
+
+# A tracker's MAC never changes, so format/encode it once per tracker rather than per HID frame.
+_mac_label = functools.lru_cache(maxsize=8)(mac_str)
+
+
+@functools.lru_cache(maxsize=8)
+def _encode_mac(mac: str) -> bytes:
+    return mac.encode("utf-8")[:MAC_STR_LEN - 1]
+
+
+# Shared stand-in for IMU fields that the shared pose buffer does not carry.
+_ZERO3 = np.zeros(3)
+_ZERO3.flags.writeable = False
+
+
+def _mlock_buffer(buf) -> bool:
+    """Best-effort ``mlock`` of a mapped buffer so the pose rings are never paged out."""
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        addr = ctypes.addressof(ctypes.c_char.from_buffer(buf))
+        if libc.mlock(ctypes.c_void_p(addr), ctypes.c_size_t(len(buf))) == 0:
+            return True
+        logger.debug("mlock of shared pose buffer failed: %s", os.strerror(ctypes.get_errno()))
+    except (AttributeError, OSError, TypeError):
+        logger.debug("mlock is not available on this platform")
+    return False
+
+
+def _pack_pose_row(row: np.ndarray, pose: "TrackerPose") -> None:
+    row[:3] = pose.position
+    row[3:7] = pose.rotation
+    row[7] = pose.timestamp_ms
+    row[8] = pose.buttons
+    row[9] = pose.tracking_status
+    row[10] = 1.0
 
 
 class SharedPoseBuffer:
+    """Per-tracker pose rings shared between the tracker process and a consumer process.
+
+    Each slot is a single-producer/single-consumer ring of ``RING_DEPTH`` records plus a tail
+    counter holding the number of records ever published. The writer fills record
+    ``tail % RING_DEPTH`` and only then bumps the tail, so no cross-process lock is needed.
+    A record is only overwritten once the tail has moved ``RING_DEPTH`` past it; readers re-check
+    the tail after copying and discard anything the writer may have lapped. This relies on the
+    in-order stores of x86-64 since Python offers no explicit memory fences.
+    """
+
     def __init__(self):
-        total_bytes = POSE_SLOTS * POSE_FIELDS * np.dtype(np.float64).itemsize
-        self.shm = shared_memory.SharedMemory(create=True, size=total_bytes)
-        self.array = np.ndarray((POSE_SLOTS, POSE_FIELDS), dtype=np.float64, buffer=self.shm.buf)
-        self.lock = mp.Lock()
-        self.mac_buffer = mp.Array('c', MAC_STR_LEN * POSE_SLOTS)
-        self.write_timestamps = mp.Array('d', POSE_SLOTS)
-        self.sequence_numbers = mp.Array('L', POSE_SLOTS)
+        self.shm = shared_memory.SharedMemory(create=True, size=_SHM_BYTES)
         self._owns_shm = True
+        self._row_scratch = np.empty(POSE_FIELDS, dtype=np.float64)
+        self._read_scratch = np.empty((POSE_SLOTS, POSE_FIELDS), dtype=np.float64)
+        self._written_macs = [b""] * POSE_SLOTS
+        self._last_rows = np.full((POSE_SLOTS, POSE_FIELDS), np.nan)
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self.shm.buf)
+        header["magic"] = _SHM_MAGIC
+        header["version"] = _SHM_VERSION
+        header["slots"] = POSE_SLOTS
+        header["ring_depth"] = RING_DEPTH
+        header["slot_bytes"] = _SLOT_DTYPE.itemsize
+        del header
+        self._map_views()
 
     @classmethod
-    def attach(
-        cls,
-        shm_name: str,
-        lock,
-        mac_buffer,
-        write_timestamps,
-        sequence_numbers,
-    ) -> "SharedPoseBuffer":
-        total_bytes = POSE_SLOTS * POSE_FIELDS * np.dtype(np.float64).itemsize
+    def attach(cls, shm_name: str) -> "SharedPoseBuffer":
         instance = cls.__new__(cls)
         instance.shm = shared_memory.SharedMemory(name=shm_name)
-        instance.array = np.ndarray((POSE_SLOTS, POSE_FIELDS), dtype=np.float64, buffer=instance.shm.buf)
-        instance.lock = lock
-        instance.mac_buffer = mac_buffer
-        instance.write_timestamps = write_timestamps
-        instance.sequence_numbers = sequence_numbers
         instance._owns_shm = False
+        instance._row_scratch = np.empty(POSE_FIELDS, dtype=np.float64)
+        instance._read_scratch = np.empty((POSE_SLOTS, POSE_FIELDS), dtype=np.float64)
+        instance._written_macs = [b""] * POSE_SLOTS
+        instance._last_rows = np.full((POSE_SLOTS, POSE_FIELDS), np.nan)
+        instance._map_views()
         return instance
 
+    def _map_views(self) -> None:
+        buf = self.shm.buf
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=buf)
+        layout = tuple(int(header[name]) for name in _LAYOUT_FIELDS)
+        del header
+        if layout != (_SHM_MAGIC, _SHM_VERSION, POSE_SLOTS, RING_DEPTH, _SLOT_DTYPE.itemsize):
+            raise ValueError(f"Shared memory block {self.shm.name!r} has an incompatible pose layout")
+        # Keep the rings resident so neither side takes a page fault in the middle of a publish.
+        _mlock_buffer(buf)
+
+        base = _HEADER_DTYPE.itemsize
+        self._slots = np.frombuffer(buf, dtype=_SLOT_DTYPE, count=POSE_SLOTS, offset=base)
+        # (POSE_SLOTS, RING_DEPTH, POSE_FIELDS) and (POSE_SLOTS, RING_DEPTH) views into the rings.
+        self.records = self._slots["records"]["pose"]
+        self.write_timestamps = self._slots["records"]["write_time"]
+
+        # Ring tails, i.e. how many samples each slot has published. The numpy view lets a reader
+        # snapshot every slot at once; the ctypes views give plain-int loads/stores per slot.
+        tails_offset = _HEADER_DTYPE.fields["tails"][1]
+        self.sequence_numbers = np.frombuffer(buf, dtype=np.uint64, count=POSE_SLOTS, offset=tails_offset)
+        self._tail = [ctypes.c_uint64.from_buffer(buf, tails_offset + slot * 8) for slot in range(POSE_SLOTS)]
+
+        mac_offset = _SLOT_DTYPE.fields["mac"][1]
+        slot_bytes = _SLOT_DTYPE.itemsize
+        self._mac_views = [
+            buf[base + slot * slot_bytes + mac_offset:base + slot * slot_bytes + mac_offset + MAC_STR_LEN]
+            for slot in range(POSE_SLOTS)
+        ]
+
     def close(self):
+        # Every view into the block pins the mmap; drop them before closing it.
+        self._tail = []
+        for view in self._mac_views:
+            view.release()
+        self._mac_views = []
+        self._slots = self.records = self.write_timestamps = self.sequence_numbers = None
         self.shm.close()
         if self._owns_shm:
             self.shm.unlink()
@@ -60,33 +190,68 @@ class SharedPoseBuffer:
     def write_pose(self, tracker_index: int, pose: "TrackerPose") -> None:
         if tracker_index < 0 or tracker_index >= POSE_SLOTS:
             return
-        with self.lock:
-            row = self.array[tracker_index]
-            row[:3] = pose.position
-            row[3:7] = pose.rotation
-            row[7] = pose.timestamp_ms
-            row[8] = float(pose.buttons)
-            row[9] = float(pose.tracking_status)
-            row[10] = 1.0
-            raw_mac = pose.mac.encode("utf-8")[:MAC_STR_LEN - 1]
-            offset = tracker_index * MAC_STR_LEN
-            self.mac_buffer[offset:offset + MAC_STR_LEN] = b"\x00" * MAC_STR_LEN
-            self.mac_buffer[offset:offset + len(raw_mac)] = raw_mac
-            self.write_timestamps[tracker_index] = time.time()
-            self.sequence_numbers[tracker_index] += 1
+        _pack_pose_row(self._row_scratch, pose)
+        self.write_row(tracker_index, self._row_scratch, _encode_mac(pose.mac))
+
+    def write_row(self, tracker_index: int, row: np.ndarray, raw_mac: bytes) -> None:
+        """Publish an already packed ``POSE_FIELDS`` row for a tracker slot.
+
+        A row identical to the last one published for the slot (same timestamp, buttons, status
+        and pose) is skipped, so repeated reports of a stationary tracker cost no ring record.
+        """
+
+        if tracker_index < 0 or tracker_index >= POSE_SLOTS:
+            return
+        last_row = self._last_rows[tracker_index]
+        # Compare the scalar fields first: a fresh sample almost always differs in timestamp_ms,
+        # so the common path costs one float compare instead of a full array_equal.
+        if (
+            row[7] == last_row[7]
+            and row[8] == last_row[8]
+            and row[9] == last_row[9]
+            and np.array_equal(row[:7], last_row[:7])
+        ):
+            return
+        np.copyto(last_row, row)
+        tail = self._tail[tracker_index]
+        count = tail.value
+        pos = count & (RING_DEPTH - 1)
+        np.copyto(self.records[tracker_index, pos], row)
+        self.write_timestamps[tracker_index, pos] = time.time()
+        if raw_mac != self._written_macs[tracker_index]:
+            mac = self._mac_views[tracker_index]
+            mac[:len(raw_mac)] = raw_mac
+            mac[len(raw_mac)] = 0
+            self._written_macs[tracker_index] = raw_mac
+        tail.value = count + 1
+
+    def read_sequence_numbers(self) -> np.ndarray:
+        """Return a copy of every slot's published-sample count."""
+
+        return self.sequence_numbers.copy()
 
     def read_pose(self, tracker_index: int) -> Optional[Dict]:
+        """Snapshot the newest record of a tracker slot.
+
+        ``position`` and ``rotation`` are views into this slot's scratch row, which the next
+        ``read_pose`` of the same tracker overwrites; copy them if they need to outlive that.
+        """
+
         if tracker_index < 0 or tracker_index >= POSE_SLOTS:
             return None
-        offset = tracker_index * MAC_STR_LEN
-        with self.lock:
-            row = self.array[tracker_index].copy()
-            write_time = self.write_timestamps[tracker_index]
-            sequence = int(self.sequence_numbers[tracker_index])
-            raw_mac = bytes(self.mac_buffer[offset:offset + MAC_STR_LEN])
-        if row[10] < 0.5:
-            return None
-        mac = raw_mac.split(b"\x00", 1)[0]
+        tail = self._tail[tracker_index]
+        row = self._read_scratch[tracker_index]
+        while True:
+            count = tail.value
+            if count == 0:
+                return None
+            pos = (count - 1) & (RING_DEPTH - 1)
+            np.copyto(row, self.records[tracker_index, pos])
+            write_time = float(self.write_timestamps[tracker_index, pos])
+            # The writer starts overwriting this record once the tail reaches count - 1 + RING_DEPTH.
+            if tail.value - count < RING_DEPTH - 1:
+                break
+        mac = bytes(self._mac_views[tracker_index]).split(b"\x00", 1)[0]
         return {
             "position": row[:3],
             "rotation": row[3:7],
@@ -95,31 +260,234 @@ class SharedPoseBuffer:
             "tracking_status": int(row[9]),
             "mac": mac.decode("utf-8", errors="ignore"),
             "write_time": write_time,
-            "sequence": sequence,
+            "sequence": count,
         }
 
+    def read_since(self, tracker_index: int, head: int) -> Tuple[np.ndarray, int, int]:
+        """Copy every record published after ``head`` for a tracker slot.
 
-def _tracker_process_main(mode: str, wifi_info_path: Optional[str], shm_name: str, lock, mac_buffer, write_timestamps, sequence_numbers, stop_event):
-    api = UltimateTrackerAPI(mode=mode, wifi_info_path=wifi_info_path)
-    buffer = SharedPoseBuffer.attach(shm_name, lock, mac_buffer, write_timestamps, sequence_numbers)
+        ``head`` is the value returned by the previous call (0 initially). Returns
+        ``(rows, new_head, dropped)`` where ``rows`` is a ``(k, POSE_FIELDS)`` array in publish
+        order and ``dropped`` counts records the writer overwrote before they could be read. At most
+        ``RING_DEPTH - 1`` records come back: the oldest one of a full ring may be mid-overwrite.
+        """
 
-    def handle_pose(pose: TrackerPose) -> None:
-        buffer.write_pose(pose.tracker_index, pose)
+        if tracker_index < 0 or tracker_index >= POSE_SLOTS:
+            return np.empty((0, POSE_FIELDS), dtype=np.float64), head, 0
+        tail = self._tail[tracker_index]
+        count = tail.value
+        start = max(head, count - RING_DEPTH)
+        positions = np.arange(start, count) & (RING_DEPTH - 1)
+        rows = self.records[tracker_index, positions]
+        # Leading records at or below tail - RING_DEPTH may have been overwritten while copying.
+        torn = min(max(0, tail.value - RING_DEPTH + 1 - start), count - start)
+        return rows[torn:], count, (start - head) + torn
+
+
+class _PosePublisher:
+    """Moves pose samples from the HID thread into a SharedPoseBuffer on its own thread.
+
+    The HID callback only packs the sample into a preallocated row of an in-process ring and
+    bumps the head index. The publisher thread drains whatever accumulated since its last pass
+    into the shared rings, keeping shared-memory writes off the HID polling deadline.
+
+    The HID thread never waits for the publisher, so a slow sink (e.g. a full pipe) lets it lap
+    the ring. Lapped samples are skipped and added to ``dropped``, a ``c_uint64``-like counter
+    that TrackerService shares with the consumer process.
+    """
+
+    def __init__(self, buffer, depth: int = 64, dropped=None) -> None:
+        self._buffer = buffer
+        self._depth = depth
+        self.dropped = dropped if dropped is not None else ctypes.c_uint64()
+        self._rows = np.zeros((depth, POSE_FIELDS), dtype=np.float64)
+        self._row_scratch = np.empty(POSE_FIELDS, dtype=np.float64)
+        self._slots = [0] * depth
+        self._macs = [b""] * depth
+        self._head = 0  # only advanced by the HID thread
+        self._tail = 0  # only advanced by the publisher thread
+        self._wakeup = threading.Event()
+        self._running = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, pose: "TrackerPose") -> None:
+        pos = self._head % self._depth
+        _pack_pose_row(self._rows[pos], pose)
+        self._slots[pos] = pose.tracker_index
+        self._macs[pos] = _encode_mac(pose.mac)
+        self._head += 1
+        # Event.set takes the Condition lock and notifies; is_set is a plain flag read, so only
+        # the first sample after the publisher clears the flag pays for the wakeup.
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def start(self) -> None:
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
 
-    api.add_pose_callback(handle_pose)
+    def stop(self) -> None:
+        self._running.clear()
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def _run(self) -> None:
+        depth, row = self._depth, self._row_scratch
+        while self._running.is_set():
+            self._wakeup.wait(0.1)
+            self._wakeup.clear()
+            head = self._head
+            # If the HID thread lapped us, the oldest rows are already overwritten.
+            start = max(self._tail, head - depth)
+            lapped = start - self._tail
+            for seq in range(start, head):
+                pos = seq % depth
+                np.copyto(row, self._rows[pos])
+                slot, raw_mac = self._slots[pos], self._macs[pos]
+                # The HID thread starts rewriting this entry once it packs sample seq + depth.
+                if self._head - seq >= depth:
+                    lapped += 1
+                    continue
+                self._buffer.write_row(slot, row, raw_mac)
+            self._tail = head
+            if lapped:
+                self.dropped.value += lapped
+
+
+class _PipePoseWriter:
+    """Tracker-process end of ``TrackerService(transport="pipe")``: one message per pose."""
+
+    def __init__(self, conn) -> None:
+        self._conn = conn
+        self._msg = bytearray(_PIPE_POSE_STRUCT.size)
+
+    def write_row(self, tracker_index: int, row: np.ndarray, raw_mac: bytes) -> None:
+        _PIPE_POSE_STRUCT.pack_into(
+            self._msg, 0, tracker_index, int(row[9]), int(row[8]), int(row[7]), time.time(), *row[:7], raw_mac
+        )
+        try:
+            self._conn.send_bytes(self._msg)
+        except OSError:
+            pass  # consumer went away; the service is shutting down
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class _PipePoseReader:
+    """Consumer end of ``TrackerService(transport="pipe")``.
+
+    Mirrors the SharedPoseBuffer read API. Pending messages are drained on every read; up to
+    ``RING_DEPTH - 1`` samples per tracker are kept for ``read_since`` (the usable depth of a
+    SharedPoseBuffer ring) and older ones count as dropped.
+    """
+
+    def __init__(self, conn) -> None:
+        self._conn = conn
+        self._msg = bytearray(_PIPE_POSE_STRUCT.size)
+        self._read_scratch = np.empty((POSE_SLOTS, POSE_FIELDS), dtype=np.float64)
+        self._latest = [None] * POSE_SLOTS
+        self._counts = [0] * POSE_SLOTS
+        self._pending = [deque(maxlen=RING_DEPTH - 1) for _ in range(POSE_SLOTS)]
+        self._overflow = [0] * POSE_SLOTS
+
+    def _drain(self) -> None:
+        conn = self._conn
+        while conn.poll(0):
+            conn.recv_bytes_into(self._msg)
+            fields = _PIPE_POSE_STRUCT.unpack_from(self._msg)
+            slot = fields[0]
+            if slot >= POSE_SLOTS:
+                continue
+            pending = self._pending[slot]
+            if len(pending) == pending.maxlen:
+                self._overflow[slot] += 1
+            pending.append(fields)
+            self._latest[slot] = fields
+            self._counts[slot] += 1
+
+    @staticmethod
+    def _fill_row(row: np.ndarray, fields: tuple) -> None:
+        row[:7] = fields[5:12]
+        row[7] = fields[3]
+        row[8] = fields[2]
+        row[9] = fields[1]
+        row[10] = 1.0
+
+    def read_pose(self, tracker_index: int) -> Optional[Dict]:
+        if tracker_index < 0 or tracker_index >= POSE_SLOTS:
+            return None
+        self._drain()
+        fields = self._latest[tracker_index]
+        if fields is None:
+            return None
+        row = self._read_scratch[tracker_index]
+        self._fill_row(row, fields)
+        return {
+            "position": row[:3],
+            "rotation": row[3:7],
+            "timestamp_ms": fields[3],
+            "buttons": fields[2],
+            "tracking_status": fields[1],
+            "mac": fields[12].split(b"\x00", 1)[0].decode("utf-8", errors="ignore"),
+            "write_time": fields[4],
+            "sequence": self._counts[tracker_index],
+        }
+
+    def read_sequence_numbers(self) -> np.ndarray:
+        self._drain()
+        return np.array(self._counts, dtype=np.uint64)
+
+    def read_since(self, tracker_index: int, head: int) -> Tuple[np.ndarray, int, int]:
+        if tracker_index < 0 or tracker_index >= POSE_SLOTS:
+            return np.empty((0, POSE_FIELDS), dtype=np.float64), head, 0
+        self._drain()
+        pending = self._pending[tracker_index]
+        rows = np.empty((len(pending), POSE_FIELDS), dtype=np.float64)
+        for row, fields in zip(rows, pending):
+            self._fill_row(row, fields)
+        pending.clear()
+        dropped = self._overflow[tracker_index]
+        self._overflow[tracker_index] = 0
+        return rows, self._counts[tracker_index], dropped
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _tracker_process_main(
+    mode: str, wifi_info_path: Optional[str], transport: str, endpoint, stop_event, publisher_dropped
+):
+    api = UltimateTrackerAPI(mode=mode, wifi_info_path=wifi_info_path)
+    if transport == "pipe":
+        buffer = _PipePoseWriter(endpoint)
+    else:
+        buffer = SharedPoseBuffer.attach(endpoint)
+    publisher = _PosePublisher(buffer, dropped=publisher_dropped)
+
+    api.add_pose_callback(publisher.submit)
+    publisher.start()
     api.start()
     try:
         while not stop_event.is_set():
             stop_event.wait(0.005)
     finally:
         api.stop()
+        publisher.stop()
         buffer.close()
 
 
 
 @dataclass
 class TrackerPose:
-    """Representation of a single 6DoF pose sample coming from a tracker."""
+    """Representation of a single 6DoF pose sample coming from a tracker.
+
+    Pose callbacks receive one instance per tracker that UltimateTrackerAPI updates in place for
+    every sample, so copy the fields (e.g. ``pose.position.copy()``) if you need to keep a sample
+    around. ``get_latest_pose`` and ``iter_latest_poses`` return independent snapshots.
+    """
 
     tracker_index: int
     mac: str
@@ -141,13 +509,26 @@ class UltimateTrackerAPI:
     def __init__(
         self,
         mode: str = "DONGLE_USB",
-        poll_interval: float = 0.001,
+        poll_interval: Optional[float] = None,
         wifi_info_path: Optional[str] = None,
+        *,
+        read_timeout: float = 0.1,
     ) -> None:
+        if poll_interval is not None:
+            warnings.warn(
+                "poll_interval is ignored since the polling thread blocks in HID reads; use read_timeout",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self._group = ViveTrackerGroup(mode=mode, wifi_info_path=wifi_info_path)
-        self._poll_interval = max(0.0, poll_interval)
-        self._pose_callbacks: List[PoseCallback] = []
+        # Upper bound on how long the polling thread blocks in a HID read before it rechecks stop().
+        # Kept at >= 1 ms: a 0 ms HID read does not block and would turn the loop into a busy spin.
+        self._read_timeout = max(0.001, read_timeout)
+        # Replaced wholesale on add/remove so the pose path can iterate it without copying.
+        self._pose_callbacks: Tuple[PoseCallback, ...] = ()
         self._latest_pose: Dict[int, TrackerPose] = {}
+        # Same row layout as SharedPoseBuffer.records; each TrackerPose's position/rotation view into it.
+        self._poses = np.zeros((POSE_SLOTS, POSE_FIELDS), dtype=np.float64)
         self._lock = threading.Lock()
         self._thread: Optional[threading.Thread] = None
         self._running = threading.Event()
@@ -186,49 +567,95 @@ class UltimateTrackerAPI:
         self.stop()
 
     def add_pose_callback(self, callback: PoseCallback) -> None:
-        """Register a callback that receives TrackerPose objects as they stream in."""
+        """Register a callback that receives TrackerPose objects as they stream in.
 
-        if callback not in self._pose_callbacks:
-            self._pose_callbacks.append(callback)
+        The pose object is reused for the tracker's next sample; copy anything you keep.
+        """
+
+        with self._lock:
+            if callback not in self._pose_callbacks:
+                self._pose_callbacks = self._pose_callbacks + (callback,)
 
     def remove_pose_callback(self, callback: PoseCallback) -> None:
-        self._pose_callbacks = [cb for cb in self._pose_callbacks if cb != callback]
+        with self._lock:
+            self._pose_callbacks = tuple(cb for cb in self._pose_callbacks if cb != callback)
+
+    @staticmethod
+    def _snapshot(pose: TrackerPose) -> TrackerPose:
+        # The pooled pose keeps changing under the HID thread; callers outside callbacks get a copy.
+        return replace(
+            pose,
+            position=pose.position.copy(),
+            rotation=pose.rotation.copy(),
+            acceleration=pose.acceleration.copy(),
+            angular_velocity=pose.angular_velocity.copy(),
+        )
 
     def get_latest_pose(self, tracker_index: int) -> Optional[TrackerPose]:
-        """Return the most recent pose for the requested tracker index, if available."""
+        """Return a snapshot of the most recent pose for the requested tracker index, if available."""
 
         with self._lock:
-            return self._latest_pose.get(tracker_index)
+            pose = self._latest_pose.get(tracker_index)
+            return self._snapshot(pose) if pose is not None else None
 
     def iter_latest_poses(self) -> Iterable[TrackerPose]:
-        """Iterate over the most recent poses for all trackers that have reported."""
+        """Iterate over snapshots of the most recent poses for all trackers that have reported."""
 
         with self._lock:
-            return list(self._latest_pose.values())
+            return [self._snapshot(pose) for pose in self._latest_pose.values()]
+
+    def latest_poses_array(self) -> np.ndarray:
+        """Return a copy of the latest poses as a ``(POSE_SLOTS, POSE_FIELDS)`` float64 array.
+
+        Columns are ``[px, py, pz, rw, rx, ry, rz, timestamp_ms, buttons, tracking_status, valid]``;
+        rows of trackers that have not reported yet have ``valid == 0``.
+        """
+
+        with self._lock:
+            return self._poses.copy()
 
     def _loop_forever(self) -> None:
         while self._running.is_set():
-            self._group.do_loop()
-            if self._poll_interval:
-                time.sleep(self._poll_interval)
-
-    def _handle_pose_event(self, sample: Dict) -> None:
-        pose = TrackerPose(
-            tracker_index=sample["tracker_index"],
-            mac=mac_str(sample["mac"]),
-            buttons=sample["buttons"],
-            tracking_status=sample["tracking_status"],
-            timestamp_ms=sample["timestamp_ms"],
-            position=sample["position"],
-            rotation=sample["rotation"],
-            acceleration=sample["acceleration"],
-            angular_velocity=sample["angular_velocity"],
-        )
+            self._group.wait_next_report(timeout=self._read_timeout)
+
+    def _handle_pose_event(self, sample: PoseSample) -> None:
+        tracker_index = sample.tracker_index
+        if tracker_index < 0 or tracker_index >= POSE_SLOTS:
+            return
 
         with self._lock:
-            self._latest_pose[pose.tracker_index] = pose
+            row = self._poses[tracker_index]
+            row[:3] = sample.position
+            row[3:7] = sample.rotation
+            row[7] = sample.timestamp_ms
+            row[8] = sample.buttons
+            row[9] = sample.tracking_status
+            row[10] = 1.0
 
-        for callback in list(self._pose_callbacks):
+            pose = self._latest_pose.get(tracker_index)
+            if pose is None:
+                pose = TrackerPose(
+                    tracker_index=tracker_index,
+                    mac=_mac_label(sample.mac),
+                    buttons=sample.buttons,
+                    tracking_status=sample.tracking_status,
+                    timestamp_ms=sample.timestamp_ms,
+                    position=row[:3],
+                    rotation=row[3:7],
+                    acceleration=np.array(sample.acceleration, dtype=np.float32),
+                    angular_velocity=np.array(sample.angular_velocity, dtype=np.float32),
+                )
+                self._latest_pose[tracker_index] = pose
+            else:
+                # position/rotation are views of the row above; only the rest needs updating.
+                pose.mac = _mac_label(sample.mac)
+                pose.buttons = sample.buttons
+                pose.tracking_status = sample.tracking_status
+                pose.timestamp_ms = sample.timestamp_ms
+                np.copyto(pose.acceleration, sample.acceleration)
+                np.copyto(pose.angular_velocity, sample.angular_velocity)
+
+        for callback in self._pose_callbacks:
             try:
                 callback(pose)
             except Exception:  # pragma: no cover - defensive logging
@@ -236,28 +663,47 @@ class UltimateTrackerAPI:
 
 
 class TrackerService:
-    """Runs the tracker polling loop inside its own process and shares poses through shared memory."""
-
-    def __init__(self, mode: str = "DONGLE_USB", wifi_info_path: Optional[str] = None):
-        self._buffer = SharedPoseBuffer()
+    """Runs the tracker polling loop inside its own process and shares poses with this one.
+
+    ``transport="shm"`` (default) publishes into a SharedPoseBuffer. ``transport="pipe"`` sends
+    one small message per pose over a ``multiprocessing.Pipe`` instead, which is enough for
+    consumers that only poll the latest pose at display rates.
+    """
+
+    def __init__(self, mode: str = "DONGLE_USB", wifi_info_path: Optional[str] = None, transport: str = "shm"):
+        send_conn = None
+        if transport == "shm":
+            self._buffer = SharedPoseBuffer()
+            endpoint = self._buffer.shm.name
+        elif transport == "pipe":
+            recv_conn, send_conn = mp.Pipe(duplex=False)
+            self._buffer = _PipePoseReader(recv_conn)
+            endpoint = send_conn
+        else:
+            raise ValueError(f"Unknown transport {transport!r}; expected 'shm' or 'pipe'")
         self._stop_event = mp.Event()
+        # Only the tracker process's publisher thread writes this, so it needs no lock.
+        self._publisher_dropped = mp.RawValue(ctypes.c_uint64, 0)
         self._process = mp.Process(
             target=_tracker_process_main,
             args=(
                 mode,
                 wifi_info_path,
-                self._buffer.shm.name,
-                self._buffer.lock,
-                self._buffer.mac_buffer,
-                self._buffer.write_timestamps,
-                self._buffer.sequence_numbers,
+                transport,
+                endpoint,
                 self._stop_event,
+                self._publisher_dropped,
             ),
             daemon=True,
         )
         self._process.start()
+        if send_conn is not None:
+            # The child owns the write end now.
+            send_conn.close()
         self._last_pose_age_ms: Optional[float] = None
         self._last_pose_sequence: Optional[int] = None
+        self._heads = [0] * POSE_SLOTS
+        self._dropped_count = 0
         self._running = True
 
     @property
@@ -272,7 +718,49 @@ class TrackerService:
     def last_pose_sequence(self) -> Optional[int]:
         return self._last_pose_sequence
 
+    def sequence_numbers(self) -> np.ndarray:
+        """Return how many samples each tracker slot has published, as a ``(POSE_SLOTS,)`` array.
+
+        Comparing two snapshots tells which trackers have new data without reading any pose.
+        """
+
+        return self._buffer.read_sequence_numbers()
+
+    @property
+    def dropped_count(self) -> int:
+        """Samples lost before get_new_poses() could read them.
+
+        Counts samples overwritten in the shared rings (or the pipe reader's backlog) plus those
+        the tracker process had to skip because its publisher could not keep up with the HID thread.
+        """
+
+        return self._dropped_count + self._publisher_dropped.value
+
+    def get_new_poses(self, tracker_index: int) -> np.ndarray:
+        """Return every sample published for a tracker since the previous call, oldest first.
+
+        Rows use the ``(k, POSE_FIELDS)`` layout of ``UltimateTrackerAPI.latest_poses_array``.
+        Samples lost because this was not called within ``RING_DEPTH - 1`` samples are added to
+        ``dropped_count``; the oldest record of a full ring is never returned since the writer
+        may be overwriting it.
+        """
+
+        if tracker_index < 0 or tracker_index >= POSE_SLOTS:
+            return np.empty((0, POSE_FIELDS), dtype=np.float64)
+        rows, self._heads[tracker_index], dropped = self._buffer.read_since(
+            tracker_index, self._heads[tracker_index]
+        )
+        self._dropped_count += dropped
+        return rows
+
     def get_pose(self, tracker_index: int) -> Optional[TrackerPose]:
+        """Return the latest pose for a tracker slot, or None if it has not reported yet.
+
+        ``position`` and ``rotation`` view this service's read buffer for the tracker and are
+        overwritten by the next ``get_pose`` of the same tracker; copy them to keep a sample. The shared buffer carries no IMU data,
+        so ``acceleration`` and ``angular_velocity`` are read-only zeros.
+        """
+
         data = self._buffer.read_pose(tracker_index)
         if data is None:
             return None
@@ -284,10 +772,10 @@ class TrackerService:
             buttons=data["buttons"],
             tracking_status=data["tracking_status"],
             timestamp_ms=data["timestamp_ms"],
-            position=np.array(data["position"], dtype=float),
-            rotation=np.array(data["rotation"], dtype=float),
-            acceleration=np.zeros(3),
-            angular_velocity=np.zeros(3),
+            position=data["position"],
+            rotation=data["rotation"],
+            acceleration=_ZERO3,
+            angular_velocity=_ZERO3,
         )
 
     def stop(self):
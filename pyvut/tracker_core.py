@@ -5,6 +5,7 @@ import time
 import json
 import logging
 from builtins import print as _builtin_print
+from collections import namedtuple
 from pathlib import Path
 
 from .enums_usb import *
@@ -86,6 +87,47 @@ def mac_to_idx(b):
         return b
     return b[1] & 0xF
 
+# idx, btns, pos (3x f32), rot (4x f16), acc (3x f16), rot_vel (4x f16), tracking_status
+POSE_DATA_STRUCT = struct.Struct("<BB12s8s6s8sB")
+
+_PoseSampleBase = namedtuple(
+    "_PoseSampleBase",
+    ["tracker_index", "mac", "buttons", "tracking_status", "timestamp_ms",
+     "position", "rotation", "acceleration", "angular_velocity"],
+)
+
+# Pose event handed to ViveTrackerGroup pose listeners. Prefer attribute access
+# (sample.position); the dict-style reads older listeners used (sample["position"],
+# "position" in sample, sample.get(), keys()/items(), dict(sample)) still work.
+# Iteration and len() follow the tuple, so unpacking yields values.
+class PoseSample(_PoseSampleBase):
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._fields
+        return any(key is value for value in self)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self._fields else default
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return tuple(self)
+
+    def items(self):
+        return tuple(zip(self._fields, self))
+
 def do_u8_checksum(data):
     out = 0
     for i in range(0, len(data)):
@@ -402,10 +444,12 @@ class DongleHID(Ackable):
         if self.disconnected_callback:
             self.disconnected_callback(self, idx)
 
-    def do_loop(self):
-        resp = self.device_hid1.read(0x400)
+    # timeout_ms=None blocks until a report arrives; otherwise wait at most timeout_ms.
+    # Returns whether a report was read.
+    def do_loop(self, timeout_ms=None):
+        resp = self.device_hid1.read(0x400, timeout_ms)
         if len(resp) <= 0:
-            return
+            return False
         #verbose_print("dump:")
         #hex_dump(resp)
         #verbose_print("parsed:")
@@ -430,7 +474,7 @@ class DongleHID(Ackable):
 
             if is_unpair:
                 self.handle_disconnected(mac_to_idx(paired_mac))
-                return
+                return True
 
             # I really wish they included the index of each tracker *somewhere*, but it seems
             # like the MACs have always been fake anyhow
@@ -517,6 +561,11 @@ class DongleHID(Ackable):
         else:
             verbose_print("dump:")
             hex_dump(resp)
+        return True
+
+    # Handle one already-queued report without blocking; used to drain bursts.
+    def read_pending_report(self):
+        return self.do_loop(timeout_ms=0)
 
 class TrackerHID(Ackable):
 
@@ -627,10 +676,10 @@ class TrackerHID(Ackable):
     def get_property(self, key):
         self.send_command(PACKET_GET_PROPERTY, key.encode("utf-8"))
 
-    def parse_incoming(self):
-        resp = self.device_hid1.read(0x400)
+    def parse_incoming(self, timeout_ms=None):
+        resp = self.device_hid1.read(0x400, timeout_ms)
         if len(resp) <= 0:
-            return
+            return False
         unk0, pkt_idx, mask, hmd_us, hdcc_status0, hdcc_status1, ack_in_queue, device_status, unk3 = struct.unpack("<BHLQBBBL17s", resp[:0x27])
         #hex_dump(resp)
         verbose_print(unk0, pkt_idx, hex(mask), hmd_us, hex(hdcc_status0), hex(hdcc_status1), ack_in_queue, hex(device_status), unk3)
@@ -651,6 +700,7 @@ class TrackerHID(Ackable):
         verbose_print(netsync_str)
         verbose_print("")
         verbose_print("")
+        return True
 
     # 1=gyro, 2=body tracking(?), 3=body?
     def set_power_pcvr(self, mode):
@@ -671,8 +721,13 @@ class TrackerHID(Ackable):
     def set_camera_fps(self, val):
         self.send_command(PACKET_SET_CAMERA_FPS, [val])
 
-    def do_loop(self):
-        self.parse_incoming()
+    def do_loop(self, timeout_ms=None):
+        got_report = self.parse_incoming(timeout_ms)
+        self.do_housekeeping()
+        return got_report
+
+    # Watchdog kick (counted per call) and ACK poll; once per report, or per timed-out wait.
+    def do_housekeeping(self):
         self.kick_watchdog()
 
         #self.ack_lambda_property(self.device_addr)
@@ -683,6 +738,14 @@ class TrackerHID(Ackable):
         if data and len(data) > 1 and self.ack_callback:
             self.ack_callback(self, self.device_addr, data[1:])
 
+    # Handle one already-queued report without blocking; used to drain bursts. The empty read
+    # that ends a drain does no housekeeping, so each report still gets exactly one kick/ACK poll.
+    def read_pending_report(self):
+        if not self.parse_incoming(timeout_ms=0):
+            return False
+        self.do_housekeeping()
+        return True
+
     def is_host(self, device_addr):
         return True # TODO
 
@@ -691,8 +754,9 @@ class TrackerHID(Ackable):
 
 class ViveTrackerGroup():
 
-    def __init__(self, mode="DONGLE_USB", wifi_info_path=None, debug=True):
+    def __init__(self, mode="DONGLE_USB", wifi_info_path=None, debug=True, max_report_batch=16):
         set_tracker_core_verbose(debug)
+        self.max_report_batch = max(1, max_report_batch)
         self.poses_recvd = [0]*5
         self.pose_quat = [[0.0, 0.0, 0.0, 1.0]] * 5
         self.pose_pos = [[0.0, 0.0, 0.0]] * 5
@@ -810,7 +874,7 @@ class ViveTrackerGroup():
             verbose_print("Weird pose data.", len(data))
             hex_dump(data)
             return
-        idx, btns, pos, rot, acc, rot_vel, tracking_status = struct.unpack("<BB12s8s6s8sB", data[:0x25])
+        idx, btns, pos, rot, acc, rot_vel, tracking_status = POSE_DATA_STRUCT.unpack_from(data)
         
         # tracking_status = 2 => pose + rot
         # tracking_status = 3 => rot only
@@ -1020,6 +1084,19 @@ class ViveTrackerGroup():
     def do_loop(self):
         self.comms.do_loop()
 
+    # Block until the next HID report is handled or `timeout` seconds pass, then drain up to
+    # max_report_batch - 1 reports that queued up meanwhile before returning to the caller.
+    def wait_next_report(self, timeout=0.1):
+        # timeout=None blocks until a report arrives; otherwise wait at least 1 ms, since a 0 ms
+        # HID read returns immediately and callers looping on this would busy-spin.
+        timeout_ms = None if timeout is None else max(1, int(timeout * 1000))
+        if not self.comms.do_loop(timeout_ms=timeout_ms):
+            return 0
+        handled = 1
+        while handled < self.max_report_batch and self.comms.read_pending_report():
+            handled += 1
+        return handled
+
     def _emit_pose_event(self, idx, mac, tracking_status, buttons, pos_arr, rot_arr, acc_arr, rot_vel_arr):
         if not self.pose_listeners:
             return
@@ -1029,17 +1106,17 @@ class ViveTrackerGroup():
             self._active_tracker_slots.append(tracker_slot)
         contiguous_index = self._active_tracker_slots.index(tracker_slot)
 
-        sample = {
-            "tracker_index": contiguous_index,
-            "mac": bytes(mac),
-            "buttons": buttons,
-            "tracking_status": tracking_status,
-            "timestamp_ms": self.pose_time[tracker_slot],
-            "position": np.array(pos_arr, dtype=np.float32),
-            "rotation": np.array(rot_arr, dtype=np.float32),
-            "acceleration": np.array(acc_arr, dtype=np.float32),
-            "angular_velocity": np.array(rot_vel_arr, dtype=np.float32),
-        }
+        sample = PoseSample(
+            tracker_index=contiguous_index,
+            mac=bytes(mac),
+            buttons=buttons,
+            tracking_status=tracking_status,
+            timestamp_ms=self.pose_time[tracker_slot],
+            position=np.array(pos_arr, dtype=np.float32),
+            rotation=np.array(rot_arr, dtype=np.float32),
+            acceleration=np.array(acc_arr, dtype=np.float32),
+            angular_velocity=np.array(rot_vel_arr, dtype=np.float32),
+        )
 
         for listener in list(self.pose_listeners):
             try:
@@ -13,13 +13,21 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     pygame = None
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
 from pyvut import TrackerService
 
 POSE_REFRESH_S = 0.02
+STDOUT_FLUSH_S = 0.1
+
 
+def quat_to_euler_deg(quats: np.ndarray) -> np.ndarray:
+    """Convert an ``(N, 4)`` array of (w, x, y, z) quaternions to ``(N, 3)`` roll/pitch/yaw degrees."""
 
-def quat_to_euler_deg(quat: np.ndarray) -> np.ndarray:
-    w, x, y, z = quat
+    w, x, y, z = np.asarray(quats, dtype=np.float64).T
     t0 = +2.0 * (w * x + y * z)
     t1 = +1.0 - 2.0 * (x * x + y * y)
     roll = np.arctan2(t0, t1)
@@ -32,18 +40,29 @@ def quat_to_euler_deg(quat: np.ndarray) -> np.ndarray:
     t4 = +1.0 - 2.0 * (y * y + z * z)
     yaw = np.arctan2(t3, t4)
 
-    return np.degrees(np.array([roll, pitch, yaw]))
+    return np.degrees(np.stack([roll, pitch, yaw], axis=-1))
+
+
+_POSE_LINE = (
+    "tracker={} mac={} buttons=0x{:04x} status={}"
+    " pos=({: .3f}, {: .3f}, {: .3f}) quat=({: .3f}, {: .3f}, {: .3f}, {: .3f})"
+    " euler_deg=({: .2f}, {: .2f}, {: .2f})"
+).format
 
 
 def format_pose_line(pose, age_ms: Optional[float]) -> str:
-    pos = ", ".join(f"{axis: .3f}" for axis in pose.position)
-    rot = ", ".join(f"{axis: .3f}" for axis in pose.rotation)
-    euler = ", ".join(f"{axis: .2f}" for axis in quat_to_euler_deg(pose.rotation))
-    age_text = f" age={age_ms:.1f}ms" if age_ms is not None else ""
-    return (
-        f"tracker={pose.tracker_index} mac={pose.mac} buttons=0x{pose.buttons:04x} status={pose.tracking_status}"
-        f" pos=({pos}) quat=({rot}) euler_deg=({euler}){age_text}"
+    line = _POSE_LINE(
+        pose.tracker_index,
+        pose.mac,
+        pose.buttons,
+        pose.tracking_status,
+        *pose.position,
+        *pose.rotation,
+        *quat_to_euler_deg(pose.rotation[None])[0],
     )
+    if age_ms is not None:
+        line += f" age={age_ms:.1f}ms"
+    return line
 
 
 # --- Simple pygame visualization helpers ------------------------------------------------------
@@ -51,23 +70,36 @@ def format_pose_line(pose, age_ms: Optional[float]) -> str:
 BLACK, RED, GREEN, BLUE = (0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 128, 255)
 
 
-def quaternion_rotation_matrix(quat: np.ndarray) -> np.ndarray:
-    w, x, y, z = quat
-    r00 = 2 * (w * w + x * x) - 1
-    r01 = 2 * (x * y - w * z)
-    r02 = 2 * (x * z + w * y)
-    r10 = 2 * (x * y + w * z)
-    r11 = 2 * (w * w + y * y) - 1
-    r12 = 2 * (y * z - w * x)
-    r20 = 2 * (x * z - w * y)
-    r21 = 2 * (y * z + w * x)
-    r22 = 2 * (w * w + z * z) - 1
-    return np.array([[r00, r01, r02], [r10, r11, r12], [r20, r21, r22]])
+def _quat_to_rot(q, out):
+    w, x, y, z = q[0], q[1], q[2], q[3]
+    out[0, 0] = 2 * (w * w + x * x) - 1
+    out[0, 1] = 2 * (x * y - w * z)
+    out[0, 2] = 2 * (x * z + w * y)
+    out[1, 0] = 2 * (x * y + w * z)
+    out[1, 1] = 2 * (w * w + y * y) - 1
+    out[1, 2] = 2 * (y * z - w * x)
+    out[2, 0] = 2 * (x * z - w * y)
+    out[2, 1] = 2 * (y * z + w * x)
+    out[2, 2] = 2 * (w * w + z * z) - 1
+    return out
+
+
+if njit is not None:
+    _quat_to_rot = njit(cache=True, fastmath=True)(_quat_to_rot)
+
+# Reused by draw_axes every frame so the render loop does not allocate a new matrix.
+_ROT_OUT = np.empty((3, 3), dtype=np.float64)
+
+
+def quaternion_rotation_matrix(quat: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    if out is None:
+        out = np.empty((3, 3), dtype=np.float64)
+    return _quat_to_rot(quat, out)
 
 
 def draw_axes(surface, origin, quat, scale=100.0):
-    rot_mat = quaternion_rotation_matrix(quat)
-    axes = rot_mat * scale
+    axes = quaternion_rotation_matrix(quat, _ROT_OUT)
+    axes *= scale
     colors = (RED, GREEN, BLUE)
     for idx in range(3):
         end = origin + axes[:, idx]
@@ -128,6 +160,12 @@ def parse_args():
         help="Transport used for Vive tracker communication",
     )
     parser.add_argument("--wifi-info", dest="wifi_info", help="Optional path to wifi_info.json")
+    parser.add_argument(
+        "--transport",
+        choices=["shm", "pipe"],
+        default="shm",
+        help="How the tracker process hands poses to this one",
+    )
     parser.add_argument("--visualize", action="store_true", help="Enable pygame visualization instead of terminal logs")
     parser.add_argument("--refresh", type=float, default=POSE_REFRESH_S, help="Seconds between terminal pose prints")
     return parser.parse_args()
@@ -135,7 +173,7 @@ def parse_args():
 
 def main():
     args = parse_args()
-    tracker_service = TrackerService(mode=args.tracker_mode, wifi_info_path=args.wifi_info)
+    tracker_service = TrackerService(mode=args.tracker_mode, wifi_info_path=args.wifi_info, transport=args.transport)
 
     try:
         if args.visualize:
@@ -144,15 +182,22 @@ def main():
             vis = SimpleVisualizer(tracker_service, args.tracker_index)
             vis.run()
         else:
-            print("Streaming tracker poses via multiprocess TrackerService. Press Ctrl+C to stop.")
+            print("Streaming tracker poses via multiprocess TrackerService. Press Ctrl+C to stop.", flush=True)
+            out = sys.stdout.buffer
+            last_flush = time.monotonic()
             while True:
                 pose = tracker_service.get_pose(args.tracker_index)
                 if pose is not None:
-                    print(format_pose_line(pose, tracker_service.last_pose_age_ms))
+                    out.write(format_pose_line(pose, tracker_service.last_pose_age_ms).encode() + b"\n")
                 else:
-                    print("Waiting for tracker data...")
+                    out.write(b"Waiting for tracker data...\n")
+                now = time.monotonic()
+                if now - last_flush >= STDOUT_FLUSH_S:
+                    out.flush()
+                    last_flush = now
                 time.sleep(args.refresh)
     except KeyboardInterrupt:
+        sys.stdout.buffer.flush()
         print("\nStopping…")
     finally:
         tracker_service.stop()
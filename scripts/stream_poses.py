@@ -2,38 +2,111 @@
 """Simple demo that prints live 6DoF poses using pyvut's UltimateTrackerAPI."""
 
 import argparse
+import sys
+import threading
 import time
+from collections import deque
 from math import asin, atan2, pi
 
 from pyvut import TrackerPose, UltimateTrackerAPI  # noqa: E402
 
-def quat_to_euler_deg(quat) -> tuple:
+# The default arguments bind the math helpers as locals; this runs once per logged sample.
+def quat_to_euler_deg(quat, _atan2=atan2, _asin=asin, _deg=180.0 / pi) -> tuple:
     w, x, y, z = quat
     t0 = +2.0 * (w * x + y * z)
     t1 = +1.0 - 2.0 * (x * x + y * y)
-    roll = atan2(t0, t1)
+    roll = _atan2(t0, t1)
 
     t2 = +2.0 * (w * y - z * x)
     t2 = max(min(t2, 1.0), -1.0)
-    pitch = asin(t2)
+    pitch = _asin(t2)
 
     t3 = +2.0 * (w * z + x * y)
     t4 = +1.0 - 2.0 * (y * y + z * z)
-    yaw = atan2(t3, t4)
+    yaw = _atan2(t3, t4)
 
-    return tuple(angle * 180.0 / pi for angle in (roll, pitch, yaw))
+    return (roll * _deg, pitch * _deg, yaw * _deg)
+
+_POSE_LINE = (
+    "tracker={} mac={} status={} pos=({: .3f}, {: .3f}, {: .3f}) quat=({: .3f}, {: .3f}, {: .3f}, {: .3f})"
+    " euler_deg=({: .2f}, {: .2f}, {: .2f}) buttons={:#06x} timestamp_ms={}"
+).format
+
+def _format_entry(tracker_index, mac, tracking_status, position, rotation, buttons, timestamp_ms) -> str:
+    return _POSE_LINE(
+        tracker_index,
+        mac,
+        tracking_status,
+        *position,
+        *rotation,
+        *quat_to_euler_deg(rotation),
+        buttons,
+        timestamp_ms,
+    )
 
 def format_pose(pose: TrackerPose) -> str:
-    pos = ", ".join(f"{axis: .3f}" for axis in pose.position)
-    rot = ", ".join(f"{axis: .3f}" for axis in pose.rotation)
-    euler = ", ".join(f"{angle: .2f}" for angle in quat_to_euler_deg(pose.rotation))
-    return (
-        f"tracker={pose.tracker_index} mac={pose.mac} status={pose.tracking_status} "
-        f"pos=({pos}) quat=({rot}) euler_deg=({euler}) buttons={pose.buttons:#06x}"
-        f" timestamp_ms={pose.timestamp_ms}"
+    return _format_entry(
+        pose.tracker_index,
+        pose.mac,
+        pose.tracking_status,
+        pose.position,
+        pose.rotation,
+        pose.buttons,
+        pose.timestamp_ms,
     )
 
 
+class PoseLineLogger:
+    """Formats and writes pose lines on a background thread.
+
+    The pose callback runs on the HID thread, so it only snapshots the fields into a bounded
+    deque; a slow terminal can then never stall HID polling. When the deque is full the oldest
+    entry is discarded and counted in `dropped`.
+    """
+
+    def __init__(self, out, maxlen: int = 1024, flush_interval: float = 0.05) -> None:
+        self._out = out
+        self._queue = deque(maxlen=maxlen)
+        self._flush_interval = flush_interval
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.dropped = 0
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._thread.join(timeout=2.0)
+
+    # Called on the HID thread: no formatting here. TrackerPose objects are reused, so copy the fields.
+    def on_pose(self, pose: TrackerPose) -> None:
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self.dropped += 1
+        queue.append(
+            (
+                pose.tracker_index,
+                pose.mac,
+                pose.tracking_status,
+                pose.position.tolist(),
+                pose.rotation.tolist(),
+                pose.buttons,
+                pose.timestamp_ms,
+            )
+        )
+
+    def _run(self) -> None:
+        queue, out = self._queue, self._out
+        while True:
+            stopping = self._stopping.wait(self._flush_interval)
+            while queue:
+                out.write(_format_entry(*queue.popleft()).encode() + b"\n")
+            out.flush()
+            if stopping:
+                return
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -49,20 +122,24 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    def on_pose(pose: TrackerPose) -> None:
-        print(format_pose(pose))
+    pose_logger = PoseLineLogger(sys.stdout.buffer)
 
     print(
         "Starting UltimateTrackerAPI… Rotations are reported as quaternions (w,x,y,z) and Euler angles (roll, pitch, yaw in degrees)."
-        " Trackers emit raw (w,z,y,x) order but pyvut normalizes this for you. Press Ctrl+C to stop."
+        " Trackers emit raw (w,z,y,x) order but pyvut normalizes this for you. Press Ctrl+C to stop.",
+        flush=True,
     )
+    pose_logger.start()
     try:
         with UltimateTrackerAPI(mode=args.mode, wifi_info_path=args.wifi_info) as api:
-            api.add_pose_callback(on_pose)
+            api.add_pose_callback(pose_logger.on_pose)
             while True:
                 time.sleep(1)
     except KeyboardInterrupt:
+        pose_logger.stop()
         print("\nStopping…")
+        if pose_logger.dropped:
+            print(f"Dropped {pose_logger.dropped} pose lines because stdout could not keep up.")
 
 
 if __name__ == "__main__":